@@ -15,8 +15,20 @@ def has_ollama() -> bool:
         return False
 
 
-# Cache the result at module load time
-OLLAMA_AVAILABLE = has_ollama()
+def _ollama_available(config) -> bool:
+    """Probe Ollama, remembering only a successful probe in pytest's cache (reset with --cache-clear)."""
+    cache = getattr(config, "cache", None)
+    if cache is None:
+        return has_ollama()
+
+    if cache.get("ollama/available", False):
+        return True
+
+    # A failed probe is not cached, so the server is re-checked on the next run
+    available = has_ollama()
+    if available:
+        cache.set("ollama/available", True)
+    return available
 
 
 def pytest_addoption(parser):
@@ -30,12 +42,15 @@ def pytest_addoption(parser):
 
 
 def pytest_collection_modifyitems(config, items):
-    """Skip LLM tests unless --with-llm is passed."""
+    """Skip LLM tests unless --with-llm is passed and Ollama is available."""
     if config.getoption("--with-llm"):
-        # --with-llm given: don't skip LLM tests (but still check if Ollama is available)
-        return
+        # Only probe the server when LLM tests were actually requested
+        if _ollama_available(config):
+            return
+        skip_llm = pytest.mark.skip(reason="Ollama server not available")
+    else:
+        skip_llm = pytest.mark.skip(reason="need --with-llm option to run")
 
-    skip_llm = pytest.mark.skip(reason="need --with-llm option to run")
     for item in items:
         if "llm" in item.keywords:
             item.add_marker(skip_llm)
@@ -7,7 +7,9 @@ This script shows:
 3. Comparison of original vs enriched results
 """
 
-from online_retail_simulator import enrich, load_job_results, simulate
+import pandas as pd
+
+from online_retail_simulator import enrich, simulate
 
 
 def main():
@@ -21,10 +23,13 @@ def main():
     job_info = simulate("../simulate/config_default_simulation.yaml")
     print(f"✓ Simulation completed. Job ID: {job_info}")
 
-    # Load simulation results
-    metrics_df = load_job_results(job_info)["metrics"]
+    # Load only the metrics artifact (load_job_results would read every CSV in the job)
+    metrics_df = job_info.load_df("metrics")
+    # Parse dates once so later filters compare datetime64 values, not strings
+    metrics_df["date"] = pd.to_datetime(metrics_df["date"])
     print(f"✓ Generated {len(metrics_df)} metrics records")
-    print(f"✓ Date range: {metrics_df['date'].min()} to {metrics_df['date'].max()}")
+    date_range = metrics_df["date"].agg(["min", "max"])
+    print(f"✓ Date range: {date_range['min'].date()} to {date_range['max'].date()}")
     print(f"✓ Products: {metrics_df['product_identifier'].nunique()} unique products")
 
     # Step 2: Apply default enrichment
@@ -34,27 +39,30 @@ def main():
     print("✓ Uses gradual 7-day ramp-up with 50% max effect")
 
     # Load enriched results
-    enriched_df = load_job_results(enriched_job_info)["enriched"]
+    enriched_df = enriched_job_info.load_df("enriched")
+    enriched_df["date"] = pd.to_datetime(enriched_df["date"])
     print(f"✓ Applied enrichment to {len(enriched_df)} metrics records")
 
     # Step 3: Compare results
     print("\nStep 3: Comparing results...")
-    enrichment_start = "2024-11-15"
+    enrichment_start = pd.Timestamp("2024-11-15")
     original_post = metrics_df[metrics_df["date"] >= enrichment_start]
     enriched_post = enriched_df[enriched_df["date"] >= enrichment_start]
 
-    print(f"\nPost-enrichment period ({enrichment_start} onwards):")
-    print(f"Original total ordered_units: {original_post['ordered_units'].sum()}")
-    print(f"Enriched total ordered_units: {enriched_post['ordered_units'].sum()}")
-    print(
-        f"Quantity lift: {((enriched_post['ordered_units'].sum() / original_post['ordered_units'].sum()) - 1) * 100:.1f}%"
-    )
-
-    print(f"\nOriginal total revenue: ${original_post['revenue'].sum():.2f}")
-    print(f"Enriched total revenue: ${enriched_post['revenue'].sum():.2f}")
-    print(
-        f"Revenue lift: {((enriched_post['revenue'].sum() / original_post['revenue'].sum()) - 1) * 100:.1f}%"
-    )
+    # Compute each total once and reuse it for the printout and the ratio
+    original_units = original_post["ordered_units"].sum()
+    enriched_units = enriched_post["ordered_units"].sum()
+    original_revenue = original_post["revenue"].sum()
+    enriched_revenue = enriched_post["revenue"].sum()
+
+    print(f"\nPost-enrichment period ({enrichment_start.date()} onwards):")
+    print(f"Original total ordered_units: {original_units}")
+    print(f"Enriched total ordered_units: {enriched_units}")
+    print(f"Quantity lift: {((enriched_units / original_units) - 1) * 100:.1f}%")
+
+    print(f"\nOriginal total revenue: ${original_revenue:.2f}")
+    print(f"Enriched total revenue: ${enriched_revenue:.2f}")
+    print(f"Revenue lift: {((enriched_revenue / original_revenue) - 1) * 100:.1f}%")
 
     print(f"\n✓ Results saved to: {job_info.storage_path}/{job_info.job_id}/")
 
@@ -7,6 +7,7 @@ Discovers and executes all run_*.py files. Hard failure on any error.
 import glob
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 def main():
@@ -37,17 +38,38 @@ def main():
 
     print(f"Found {len(demo_scripts)} demo scripts")
 
-    for script_dir, script_name, script_path in demo_scripts:
-        print(f"\nRunning {os.path.relpath(script_path)}...")
-        try:
-            # Execute the script in its own directory
-            subprocess.run([sys.executable, script_name], check=True, cwd=script_dir)
-            print(f"✓ {os.path.relpath(script_path)} completed successfully")
-        except subprocess.CalledProcessError as e:
-            print(
-                f"✗ {os.path.relpath(script_path)} failed with exit code {e.returncode}"
-            )
-            raise
+    # Demos are independent processes writing to distinct job directories, so run
+    # them concurrently and capture their output to avoid interleaved printing
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        futures = {
+            pool.submit(
+                subprocess.run,
+                [sys.executable, script_name],
+                check=True,
+                cwd=script_dir,
+                capture_output=True,
+                text=True,
+            ): script_path
+            for script_dir, script_name, script_path in demo_scripts
+        }
+        for future in as_completed(futures):
+            script_path = futures[future]
+            print(f"\nOutput of {os.path.relpath(script_path)}:")
+            try:
+                result = future.result()
+                print(result.stdout, end="")
+                # Keep warnings (deprecations, library notices) from passing scripts visible
+                print(result.stderr, end="", file=sys.stderr)
+                print(f"✓ {os.path.relpath(script_path)} completed successfully")
+            except subprocess.CalledProcessError as e:
+                print(e.stdout, end="")
+                print(e.stderr, end="", file=sys.stderr)
+                print(
+                    f"✗ {os.path.relpath(script_path)} failed with exit code {e.returncode}"
+                )
+                for pending in futures:
+                    pending.cancel()
+                raise
 
     print("\n" + "=" * 60)
     print("All demos completed successfully!")
@@ -37,27 +37,26 @@ def generate_electronics_only(config: Dict) -> pd.DataFrame:
         "Smart Watches": (100, 600),
     }
 
-    categories = list(price_ranges.keys())
-    chars = list(string.ascii_uppercase + string.digits)
-
-    products = []
-    for i in range(num_products):
-        category = rng.choice(categories)
-        price_min, price_max = price_ranges[category]
-        price = round(rng.uniform(price_min, price_max), 2)
-
-        # Generate electronics-style product identifier
-        product_id = "E" + "".join(rng.choice(chars) for _ in range(9))
-
-        products.append(
-            {
-                "product_identifier": product_id,
-                "category": category,
-                "price": price,
-            }
-        )
-
-    return pd.DataFrame(products)
+    categories = np.array(list(price_ranges.keys()), dtype=object)
+    price_min, price_max = np.array(list(price_ranges.values()), dtype=np.float64).T
+
+    # Generate all electronics-style product identifiers in one draw:
+    # each row of 9 single-byte characters is reinterpreted as one 9-byte code
+    alphabet = np.frombuffer((string.ascii_uppercase + string.digits).encode(), dtype="S1")
+    char_idx = rng.integers(0, len(alphabet), size=(num_products, 9))
+    product_ids = np.char.add("E", alphabet[char_idx].view("S9").ravel().astype("U9"))
+
+    # Sample categories and prices for all products at once
+    category_idx = rng.integers(0, len(categories), size=num_products)
+    prices = np.round(rng.uniform(price_min[category_idx], price_max[category_idx]), 2)
+
+    return pd.DataFrame(
+        {
+            "product_identifier": product_ids.astype(object),
+            "category": categories[category_idx],
+            "price": prices,
+        }
+    )
 
 
 def main():
@@ -76,12 +75,8 @@ def main():
     job_id = simulate("config_custom_simulation.yaml")
     print(f"✓ Simulation completed. Job ID: {job_id}")
 
-    # Load results for analysis
-    from online_retail_simulator import load_job_results
-
-    results = load_job_results(job_id)
-    products_df = results["products"]
-    metrics_df = results["metrics"]
+    # Load only the metrics artifact used in the analysis
+    metrics_df = job_id.load_df("metrics")
 
     print(f"✓ Generated {len(metrics_df)} metrics records")
     print(f"✓ Date range: {metrics_df['date'].min()} to {metrics_df['date'].max()}")
@@ -9,7 +9,7 @@ This script shows:
 
 import os
 
-from online_retail_simulator import load_job_results, simulate_characteristics, simulate_product_details
+from online_retail_simulator import simulate_characteristics, simulate_product_details
 
 CONFIG_PATH = os.path.join(os.path.dirname(__file__), "config_product_details_simulation.yaml")
 
@@ -29,23 +29,23 @@ def main():
     # Step 1: Generate base products
     print("1. Generating base product characteristics...")
     job_info = simulate_characteristics(CONFIG_PATH)
-    products_df = load_job_results(job_info)["products"]
+    products_df = job_info.load_df("products")
     print(f"   ✓ Generated {len(products_df)} products")
 
     # Step 2: Add product details via Claude
     print("\n2. Enriching with Claude-generated details...")
     job_info = simulate_product_details(job_info, CONFIG_PATH)
-    detailed_df = load_job_results(job_info)["products"]
+    detailed_df = job_info.load_df("products")
     print(f"   ✓ Added details to {len(detailed_df)} products")
 
     # Step 3: Display results
     print("\n3. Sample product details:")
     print("-" * 60)
-    for _, row in detailed_df.head(3).iterrows():
-        print(f"   Product ID: {row['product_identifier']}")
-        print(f"   Title: {row.get('title', 'N/A')}")
-        print(f"   Brand: {row.get('brand', 'N/A')}")
-        desc = row.get("description", "N/A")
+    for row in detailed_df.head(3).itertuples(index=False):
+        print(f"   Product ID: {row.product_identifier}")
+        print(f"   Title: {getattr(row, 'title', 'N/A')}")
+        print(f"   Brand: {getattr(row, 'brand', 'N/A')}")
+        desc = getattr(row, "description", "N/A")
         if desc and len(desc) > 80:
             desc = desc[:80] + "..."
         print(f"   Description: {desc}")
@@ -7,7 +7,7 @@ This script shows:
 3. Generating synthetic product characteristics and sales metrics
 """
 
-from online_retail_simulator import load_job_results, simulate_characteristics, simulate_metrics
+from online_retail_simulator import simulate_characteristics, simulate_metrics
 
 
 def main():
@@ -20,7 +20,7 @@ def main():
         # Step 1: Generate synthetic characteristics
         print("Step 1: Generating synthetic product characteristics...")
         job_info = simulate_characteristics("config_synthesizer_simulation.yaml")
-        products_df = load_job_results(job_info)["products"]
+        products_df = job_info.load_df("products")
 
         print(f"✓ Generated {len(products_df)} synthetic products")
         print(f"✓ Columns: {list(products_df.columns)}")
@@ -28,30 +28,32 @@ def main():
         # Show category breakdown
         if "category" in products_df.columns:
             print(f"\nCategory breakdown:")
-            category_counts = products_df["category"].value_counts()
+            category_counts = products_df.groupby("category", sort=False, observed=True).size()
             for category, count in category_counts.items():
                 print(f"  {category}: {count} products")
 
         # Show price statistics
         if "price" in products_df.columns:
+            price_stats = products_df["price"].agg(["min", "max", "mean"])
             print(f"\nPrice statistics:")
-            print(f"  Min price: ${products_df['price'].min():.2f}")
-            print(f"  Max price: ${products_df['price'].max():.2f}")
-            print(f"  Mean price: ${products_df['price'].mean():.2f}")
+            print(f"  Min price: ${price_stats['min']:.2f}")
+            print(f"  Max price: ${price_stats['max']:.2f}")
+            print(f"  Mean price: ${price_stats['mean']:.2f}")
 
         # Step 2: Generate synthetic metrics
         print(f"\nStep 2: Generating synthetic metrics...")
         job_info = simulate_metrics(job_info, "config_synthesizer_simulation.yaml")
-        metrics_df = load_job_results(job_info)["metrics"]
+        metrics_df = job_info.load_df("metrics")
 
         print(f"✓ Generated {len(metrics_df)} synthetic metrics records")
         print(f"✓ Columns: {list(metrics_df.columns)}")
 
         # Show metrics statistics
         if "revenue" in metrics_df.columns:
+            revenue_stats = metrics_df["revenue"].agg(["sum", "mean"])
             print(f"\nMetrics statistics:")
-            print(f"  Total revenue: ${metrics_df['revenue'].sum():.2f}")
-            print(f"  Average order value: ${metrics_df['revenue'].mean():.2f}")
+            print(f"  Total revenue: ${revenue_stats['sum']:.2f}")
+            print(f"  Average order value: ${revenue_stats['mean']:.2f}")
             if "quantity" in metrics_df.columns:
                 print(f"  Total quantity: {metrics_df['quantity'].sum()}")
 
@@ -22,7 +22,8 @@ extensions = [
 ]
 
 # -- nbsphinx configuration --------------------------------------------------
-nbsphinx_execute = "always"
+# CI executes the notebooks in place before the build; "auto" only runs notebooks without stored outputs
+nbsphinx_execute = "auto"
 nbsphinx_allow_errors = False
 
 templates_path = ["_templates"]
@@ -1,32 +1,57 @@
 """Support functions for the Online Retail Simulator notebook."""
 
+from functools import lru_cache
+
 import matplotlib.pyplot as plt
 import pandas as pd
 import seaborn as sns
 
 
+@lru_cache(maxsize=32)
+def _palette(name, n_colors):
+    """
+    Return a cached seaborn color palette.
+
+    Parameters
+    ----------
+    name : str
+        Seaborn palette name.
+    n_colors : int
+        Number of colors to sample from the palette.
+
+    Returns
+    -------
+    tuple
+        Colors as RGB tuples.
+    """
+    return tuple(sns.color_palette(name, n_colors))
+
+
 def display_product_details(product, title, add_newline=False):
     """
     Display formatted product details.
 
     Parameters
     ----------
-    product : pandas.Series
+    product : pandas.Series or dict
         Product data with 'brand', 'title', 'description', and 'features' fields.
     title : str
         Header title to display above the product details.
     add_newline : bool, optional
         Whether to add a newline before the display (default: False).
     """
+    # Convert a row once so each field is a plain dict lookup
+    fields = product.to_dict() if isinstance(product, pd.Series) else product
+
     if add_newline:
         print()
     print("=" * 70)
     print(title)
     print("=" * 70)
-    print(f"Brand:       {product['brand']}")
-    print(f"Title:       {product['title']}")
-    print(f"Description: {product['description']}")
-    print(f"Features:    {product['features']}")
+    print(f"Brand:       {fields['brand']}")
+    print(f"Title:       {fields['title']}")
+    print(f"Description: {fields['description']}")
+    print(f"Features:    {fields['features']}")
 
 
 def plot_revenue_by_category(category_revenue):
@@ -39,7 +64,7 @@ def plot_revenue_by_category(category_revenue):
         Series with category names as index and revenue values.
     """
     fig, ax = plt.subplots(figsize=(10, 6))
-    category_revenue.plot(kind="barh", ax=ax, color=sns.color_palette("viridis", len(category_revenue)))
+    category_revenue.plot(kind="barh", ax=ax, color=list(_palette("viridis", len(category_revenue))))
     ax.set_xlabel("Revenue ($)")
     ax.set_ylabel("Category")
     ax.set_title("Total Revenue by Category")
@@ -57,18 +82,20 @@ def plot_daily_metrics_trend(daily_metrics):
     daily_metrics : pandas.DataFrame
         DataFrame with 'date' and 'revenue' columns.
     """
-    daily_metrics = daily_metrics.copy()
-    daily_metrics["date"] = pd.to_datetime(daily_metrics["date"])
+    # Parse dates only when needed; the caller's frame is left untouched
+    dates = daily_metrics["date"]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates)
 
     fig, ax = plt.subplots(figsize=(12, 5))
     ax.plot(
-        daily_metrics["date"],
+        dates,
         daily_metrics["revenue"],
         marker="o",
         linewidth=2,
         markersize=4,
     )
-    ax.fill_between(daily_metrics["date"], daily_metrics["revenue"], alpha=0.3)
+    ax.fill_between(dates, daily_metrics["revenue"], alpha=0.3)
     ax.set_xlabel("Date")
     ax.set_ylabel("Revenue ($)")
     ax.set_title("Daily Revenue Trend")
@@ -87,17 +114,12 @@ def plot_conversion_funnel(metrics):
     metrics : pandas.DataFrame
         DataFrame with 'impressions', 'visits', 'cart_adds', and 'ordered_units' columns.
     """
-    funnel_data = {
-        "Impressions": metrics["impressions"].sum(),
-        "Visits": metrics["visits"].sum(),
-        "Cart Adds": metrics["cart_adds"].sum(),
-        "Orders": metrics["ordered_units"].sum(),
-    }
-    stages = list(funnel_data.keys())
-    values = list(funnel_data.values())
+    funnel = metrics[["impressions", "visits", "cart_adds", "ordered_units"]].sum()
+    stages = ["Impressions", "Visits", "Cart Adds", "Orders"]
+    values = funnel.tolist()
 
     fig, ax = plt.subplots(figsize=(10, 6))
-    colors = sns.color_palette("Blues_r", len(stages))
+    colors = list(_palette("Blues_r", len(stages)))
     bars = ax.barh(stages[::-1], values[::-1], color=colors)
     ax.set_xlabel("Count")
     ax.set_title("Shopper Journey Funnel")
@@ -115,6 +137,28 @@ def plot_conversion_funnel(metrics):
     plt.show()
 
 
+def _daily_revenue(metrics):
+    """
+    Sum revenue per date, indexed by parsed dates.
+
+    Only the unique group keys are parsed, not every row.
+
+    Parameters
+    ----------
+    metrics : pandas.DataFrame
+        Metrics DataFrame with 'date' and 'revenue' columns.
+
+    Returns
+    -------
+    pandas.Series
+        Daily revenue with a DatetimeIndex.
+    """
+    daily = metrics.groupby("date")["revenue"].sum()
+    if not pd.api.types.is_datetime64_any_dtype(daily.index):
+        daily.index = pd.to_datetime(daily.index)
+    return daily
+
+
 def plot_treatment_effect(metrics, enriched, enrichment_start):
     """
     Plot daily revenue comparing original vs enriched data.
@@ -128,16 +172,13 @@ def plot_treatment_effect(metrics, enriched, enrichment_start):
     enrichment_start : str
         Date string (YYYY-MM-DD) when enrichment treatment began.
     """
-    daily_original = metrics.groupby("date")["revenue"].sum().reset_index()
-    daily_original["date"] = pd.to_datetime(daily_original["date"])
-
-    daily_enriched = enriched.groupby("date")["revenue"].sum().reset_index()
-    daily_enriched["date"] = pd.to_datetime(daily_enriched["date"])
+    daily_original = _daily_revenue(metrics)
+    daily_enriched = _daily_revenue(enriched)
 
     fig, ax = plt.subplots(figsize=(12, 6))
     ax.plot(
-        daily_original["date"],
-        daily_original["revenue"],
+        daily_original.index,
+        daily_original.values,
         marker="o",
         linewidth=2,
         markersize=4,
@@ -145,8 +186,8 @@ def plot_treatment_effect(metrics, enriched, enrichment_start):
         color="#1f77b4",
     )
     ax.plot(
-        daily_enriched["date"],
-        daily_enriched["revenue"],
+        daily_enriched.index,
+        daily_enriched.values,
         marker="s",
         linewidth=2,
         markersize=4,
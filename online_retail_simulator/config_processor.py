@@ -1,11 +1,16 @@
 """Configuration processing with defaults and validation."""
 
 import copy
+import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
+import yaml
 from artifact_store import ArtifactStore
 
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def _extract_param_schemas_from_defaults() -> Dict[str, Any]:
     """Extract parameter schemas from config defaults."""
@@ -25,23 +30,25 @@ def _extract_param_schemas_from_defaults() -> Dict[str, Any]:
                     params = section_config.get("PARAMS", {})
 
                     if function_name and params:
-                        schemas[backend][section][function_name] = set(params.keys())
+                        schemas[backend][section][function_name] = frozenset(params)
 
     return schemas
 
 
-def _get_param_schemas() -> Dict[str, Any]:
-    """Get parameter schemas, cached for performance."""
-    if not hasattr(_get_param_schemas, "_cache"):
-        _get_param_schemas._cache = _extract_param_schemas_from_defaults()
-    return _get_param_schemas._cache
+@lru_cache(maxsize=1)
+def load_defaults() -> Dict[str, Any]:
+    """
+    Load default configuration from package.
 
+    The bundled defaults are parsed once per process. The returned dict is
+    shared, so callers must copy it before mutating it.
+    """
+    # The defaults ship inside the package, so read them directly with libyaml when available
+    return yaml.load((Path(__file__).parent / "config_defaults.yaml").read_bytes(), Loader=_YAML_LOADER)
 
-def load_defaults() -> Dict[str, Any]:
-    """Load default configuration from package."""
-    defaults_path = str(Path(__file__).parent / "config_defaults.yaml")
-    store, filename = ArtifactStore.from_file_path(defaults_path)
-    return store.read_yaml(filename)
+
+# Parameter schemas derive from the bundled defaults, which never change at runtime
+_PARAM_SCHEMAS = _extract_param_schemas_from_defaults()
 
 
 def get_impact_defaults(function_name: str) -> Dict[str, Any]:
@@ -63,6 +70,10 @@ def deep_merge(base: Dict, override: Dict) -> Dict:
     """
     Deep merge two dictionaries, with override values taking precedence.
 
+    Neither input is modified and nothing is copied: the result shares untouched
+    subtrees and leaves with the inputs (and is ``base`` itself when ``override``
+    is empty), so copy the inputs first if the merged result will be mutated.
+
     Args:
         base: Base dictionary (defaults)
         override: Override dictionary (user config)
@@ -70,24 +81,27 @@ def deep_merge(base: Dict, override: Dict) -> Dict:
     Returns:
         Merged dictionary
     """
-    result = copy.deepcopy(base)
+    if not override:
+        return base
+
+    result = dict(base)
 
     for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
+        current = result.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            result[key] = deep_merge(current, value)
         else:
-            result[key] = copy.deepcopy(value)
+            result[key] = value
 
     return result
 
 
-def _require(config: Dict[str, Any], path: str, message: str) -> None:
-    parts = path.split(".")
+def _require(config: Dict[str, Any], parts: Tuple[str, ...], message: str) -> None:
     cur: Any = config
     for part in parts:
-        if not isinstance(cur, dict) or part not in cur or cur[part] in (None, ""):
+        cur = cur.get(part) if isinstance(cur, dict) else None
+        if cur is None or cur == "":
             raise ValueError(message)
-        cur = cur[part]
 
 
 def _validate_params(backend: str, section: str, function_name: str, params: Dict[str, Any]) -> None:
@@ -100,7 +114,7 @@ def _validate_params(backend: str, section: str, function_name: str, params: Dic
     register_metrics_function(), validation is skipped since their parameter
     schemas are not known at config processing time.
     """
-    schemas = _get_param_schemas()
+    schemas = _PARAM_SCHEMAS
 
     if backend not in schemas:
         raise ValueError(f"Unknown backend: {backend}")
@@ -113,23 +127,32 @@ def _validate_params(backend: str, section: str, function_name: str, params: Dic
         return
 
     expected_params = schemas[backend][section][function_name]
-    provided_params = set(params.keys())
 
-    # Check for unexpected parameters
-    extra_params = provided_params - expected_params
-    if extra_params:
-        raise ValueError(
-            f"Unexpected parameters for {backend}.{section}.{function_name}: "
-            f"{sorted(extra_params)}. Expected: {sorted(expected_params)}"
-        )
+    if params:
+        provided_params = frozenset(params)
+
+        # Check for unexpected parameters
+        extra_params = provided_params - expected_params
+        if extra_params:
+            raise ValueError(
+                f"Unexpected parameters for {backend}.{section}.{function_name}: "
+                f"{sorted(extra_params)}. Expected: {sorted(expected_params)}"
+            )
+
+        missing_params = expected_params - provided_params
+    else:
+        # No parameters given: nothing can be unexpected or null, only missing
+        missing_params = expected_params
 
     # Check for missing required parameters (after defaults merge)
-    missing_params = expected_params - provided_params
     if missing_params:
         raise ValueError(
             f"Missing required parameters for {backend}.{section}.{function_name}: {sorted(missing_params)}"
         )
 
+    if not params:
+        return
+
     # Check for null values that must be user-provided (only for specific params)
     required_non_null_params = {"training_data_path"}  # Only these cannot be null
     for param, value in params.items():
@@ -139,6 +162,15 @@ def _validate_params(backend: str, section: str, function_name: str, params: Dic
             )
 
 
+# (backend, section, default FUNCTION name, whether FUNCTION must be given explicitly)
+_VALIDATION_SPEC = (
+    ("RULE", "CHARACTERISTICS", "default", False),
+    ("RULE", "METRICS", "default", False),
+    ("SYNTHESIZER", "CHARACTERISTICS", None, True),
+    ("SYNTHESIZER", "METRICS", None, True),
+)
+
+
 def validate_config(config: Dict[str, Any]) -> None:
     """Validate configuration has required fields and valid parameters."""
 
@@ -146,7 +178,7 @@ def validate_config(config: Dict[str, Any]) -> None:
     if "STORAGE" in config:
         _require(
             config,
-            "STORAGE.PATH",
+            ("STORAGE", "PATH"),
             "Configuration with STORAGE must include STORAGE.PATH",
         )
 
@@ -159,45 +191,81 @@ def validate_config(config: Dict[str, Any]) -> None:
     elif not has_rule and not has_synthesizer:
         raise ValueError("Config must contain either RULE or SYNTHESIZER block")
 
-    # Validate RULE backend
-    if has_rule:
-        rule_config = config["RULE"]
-
-        # Validate CHARACTERISTICS
-        if "CHARACTERISTICS" in rule_config:
-            char_config = rule_config["CHARACTERISTICS"]
-            function_name = char_config.get("FUNCTION", "default")
-            params = char_config.get("PARAMS", {})
-            _validate_params("RULE", "CHARACTERISTICS", function_name, params)
-
-        # Validate METRICS
-        if "METRICS" in rule_config:
-            metrics_config = rule_config["METRICS"]
-            function_name = metrics_config.get("FUNCTION", "default")
-            params = metrics_config.get("PARAMS", {})
-            _validate_params("RULE", "METRICS", function_name, params)
-
-    # Validate SYNTHESIZER backend
-    if has_synthesizer:
-        syn_config = config["SYNTHESIZER"]
-
-        # Validate CHARACTERISTICS
-        if "CHARACTERISTICS" in syn_config:
-            char_config = syn_config["CHARACTERISTICS"]
-            function_name = char_config.get("FUNCTION")
-            if not function_name:
-                raise ValueError("SYNTHESIZER.CHARACTERISTICS.FUNCTION is required")
-            params = char_config.get("PARAMS", {})
-            _validate_params("SYNTHESIZER", "CHARACTERISTICS", function_name, params)
-
-        # Validate METRICS
-        if "METRICS" in syn_config:
-            metrics_config = syn_config["METRICS"]
-            function_name = metrics_config.get("FUNCTION")
-            if not function_name:
-                raise ValueError("SYNTHESIZER.METRICS.FUNCTION is required")
-            params = metrics_config.get("PARAMS", {})
-            _validate_params("SYNTHESIZER", "METRICS", function_name, params)
+    # Validate each section of the selected backend
+    backend = "RULE" if has_rule else "SYNTHESIZER"
+    backend_config = config[backend]
+    for spec_backend, section, default_function, function_required in _VALIDATION_SPEC:
+        if spec_backend != backend or section not in backend_config:
+            continue
+        section_config = backend_config[section]
+        function_name = section_config.get("FUNCTION", default_function)
+        if function_required and not function_name:
+            raise ValueError(f"{backend}.{section}.FUNCTION is required")
+        params = section_config.get("PARAMS", {})
+        _validate_params(backend, section, function_name, params)
+
+
+@lru_cache(maxsize=32)
+def _store_for(file_path: str) -> Tuple[ArtifactStore, str]:
+    """Resolve a file path to its (store, filename), reusing stores (and S3 clients) per path."""
+    return ArtifactStore.from_file_path(file_path)
+
+
+def _read_user_config(config_path: str) -> Dict[str, Any]:
+    """Read a user config file (YAML or JSON, local or S3)."""
+    store, filename = _store_for(config_path)
+
+    if not store.exists(filename):
+        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+
+    # Support both YAML and JSON for backward compatibility
+    if filename.lower().endswith((".yaml", ".yml")):
+        return store.read_yaml(filename)
+    return store.read_json(filename)
+
+
+@lru_cache(maxsize=128)
+def _read_user_config_cached(resolved_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a local config file once per (path, modification time, size)."""
+    # Local files are read in one call and parsed directly, YAML through the libyaml-backed loader
+    data = Path(resolved_path).read_bytes()
+    if resolved_path.lower().endswith((".yaml", ".yml")):
+        return yaml.load(data, Loader=_YAML_LOADER)
+    return json.loads(data)
+
+
+def load_user_config(config_path: str) -> Dict[str, Any]:
+    """
+    Load a user config, reusing the parsed result for unchanged local files.
+
+    A single simulate() call processes the same config file several times
+    (products, product details, metrics), so local files are parsed once and
+    served from cache until their modification time or size changes. Remote
+    paths are always read fresh.
+
+    Args:
+        config_path: Path to configuration file (YAML or JSON, local or S3)
+
+    Returns:
+        Parsed configuration; a private copy the caller may mutate
+
+    Raises:
+        FileNotFoundError: If config file doesn't exist
+    """
+    local_path = Path(config_path)
+    if local_path.is_file():
+        resolved = local_path.resolve()
+        stat = resolved.stat()
+        cached = _read_user_config_cached(str(resolved), stat.st_mtime_ns, stat.st_size)
+        return copy.deepcopy(cached)
+    return _read_user_config(config_path)
+
+
+def clear_config_cache() -> None:
+    """Drop all cached config parses and stores (e.g. between tests)."""
+    _read_user_config_cached.cache_clear()
+    _store_for.cache_clear()
+    load_defaults.cache_clear()
 
 
 def process_config(config_path: str) -> Dict[str, Any]:
@@ -214,37 +282,14 @@ def process_config(config_path: str) -> Dict[str, Any]:
         FileNotFoundError: If config file doesn't exist
         ValueError: If configuration is invalid
     """
-    store, filename = ArtifactStore.from_file_path(config_path)
-
-    if not store.exists(filename):
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
-
-    # Load user config - support both YAML and JSON for backward compatibility
-    if filename.lower().endswith((".yaml", ".yml")):
-        user_config = store.read_yaml(filename)
-    else:
-        user_config = store.read_json(filename)
-
-    # Load defaults
-    defaults = load_defaults()
-
-    # Remove conflicting blocks from defaults based on user config
-    # User config determines which backend to use
-    if "SYNTHESIZER" in user_config:
-        # User wants SYNTHESIZER, remove RULE from defaults
-        if "RULE" in defaults:
-            defaults = copy.deepcopy(defaults)
-            del defaults["RULE"]
-    elif "RULE" in user_config:
-        # User wants RULE, remove SYNTHESIZER from defaults
-        if "SYNTHESIZER" in defaults:
-            defaults = copy.deepcopy(defaults)
-            del defaults["SYNTHESIZER"]
-    else:
-        # User didn't specify backend, default to RULE
-        if "SYNTHESIZER" in defaults:
-            defaults = copy.deepcopy(defaults)
-            del defaults["SYNTHESIZER"]
+    user_config = load_user_config(config_path)
+
+    # Drop the conflicting backend block from defaults; the user config determines
+    # the backend and RULE is the default. The kept blocks are copied once so the
+    # merged config never aliases the cached defaults (the user config is already
+    # a private copy).
+    unused_backend = "RULE" if "SYNTHESIZER" in user_config else "SYNTHESIZER"
+    defaults = {key: copy.deepcopy(value) for key, value in load_defaults().items() if key != unused_backend}
 
     # Merge user config over defaults
     config = deep_merge(defaults, user_config)
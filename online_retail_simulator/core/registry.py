@@ -2,7 +2,35 @@
 
 import importlib
 import inspect
-from typing import Callable, Dict, List, Optional, Set
+import sys
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, List, Optional, Set
+
+
+@lru_cache(maxsize=256)
+def _cached_parameter_names(func: Callable) -> FrozenSet[str]:
+    """Return the parameter names of a hashable callable, memoized per function."""
+    return frozenset(inspect.signature(func).parameters)
+
+
+def _parameter_names(func: Callable) -> FrozenSet[str]:
+    """
+    Return the parameter names of a callable.
+
+    Args:
+        func: Callable to inspect
+
+    Returns:
+        Frozen set of parameter names
+
+    Raises:
+        ValueError, TypeError: If the callable has no inspectable signature
+    """
+    try:
+        return _cached_parameter_names(func)
+    except TypeError:
+        # Unhashable callables cannot be memoized; inspect them directly
+        return frozenset(inspect.signature(func).parameters)
 
 
 class FunctionRegistry:
@@ -23,7 +51,7 @@ class FunctionRegistry:
             default_loader: Optional callback to load default functions on first access
         """
         self._name = name
-        self._required_params = required_params
+        self._required_params = frozenset(required_params)
         self._default_loader = default_loader
         self._registry: Dict[str, Callable] = {}
         self._defaults_loaded = False
@@ -45,12 +73,12 @@ class FunctionRegistry:
         Raises:
             ValueError: If function signature doesn't include required parameters
         """
-        sig = inspect.signature(func)
-        params = set(sig.parameters.keys())
+        params = _parameter_names(func)
 
         if not self._required_params.issubset(params):
             raise ValueError(
-                f"Function {func.__name__} must have parameters: {self._required_params}. " f"Found: {params}"
+                f"Function {func.__name__} must have parameters: {set(self._required_params)}. "
+                f"Found: {set(params)}"
             )
 
         self._registry[name] = func
@@ -103,34 +131,40 @@ class FunctionRegistry:
             signature_filter: Optional function to check if a signature matches.
                               If None, uses required_params check.
 
+        Only callables defined in the module are considered; functions it merely
+        imports are not registered.
+
         Raises:
             ImportError: If module cannot be imported
         """
-        # Try to import from online_retail_simulator package first
-        try:
-            module = importlib.import_module(f"online_retail_simulator.{module_name}")
-        except (ImportError, ModuleNotFoundError):
-            # Fall back to importing as standalone module
-            module = importlib.import_module(module_name)
-
-        # Register all compatible functions
-        for name in dir(module):
-            obj = getattr(module, name)
-            if callable(obj) and not name.startswith("_"):
-                try:
-                    sig = inspect.signature(obj)
-                    params = set(sig.parameters.keys())
-
-                    # Check if function matches
-                    if signature_filter is not None:
-                        matches = signature_filter(params)
-                    else:
-                        matches = self._required_params.issubset(params)
-
-                    if matches:
-                        reg_name = f"{prefix}{name}" if prefix else name
-                        self._registry[reg_name] = obj
-
-                except (ValueError, TypeError):
-                    # Skip objects that don't have valid signatures
-                    continue
+        # Reuse an already imported module without going through the import machinery
+        package_module_name = f"online_retail_simulator.{module_name}"
+        module = sys.modules.get(package_module_name) or sys.modules.get(module_name)
+        if module is None:
+            # Try to import from online_retail_simulator package first
+            try:
+                module = importlib.import_module(package_module_name)
+            except (ImportError, ModuleNotFoundError):
+                # Fall back to importing as standalone module
+                module = importlib.import_module(module_name)
+
+        # Register all compatible functions defined in the module itself; names
+        # imported from elsewhere are skipped without inspecting their signatures
+        for name, obj in sorted(vars(module).items()):
+            if name.startswith("_") or not callable(obj) or getattr(obj, "__module__", None) != module.__name__:
+                continue
+            try:
+                params = _parameter_names(obj)
+            except (ValueError, TypeError):
+                # Skip objects that don't have valid signatures
+                continue
+
+            # Check if function matches
+            if signature_filter is not None:
+                matches = signature_filter(params)
+            else:
+                matches = self._required_params.issubset(params)
+
+            if matches:
+                reg_name = f"{prefix}{name}" if prefix else name
+                self._registry[reg_name] = obj
@@ -3,12 +3,10 @@ Interface for applying enrichment treatments to metrics data.
 Dispatches to impact-based implementation based on config.
 """
 
-import copy
 from typing import Any, Callable, Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
-from artifact_store import ArtifactStore
 
 
 def parse_impact_spec(impact_spec: Dict) -> Tuple[str, str, Dict[str, Any]]:
@@ -53,8 +51,8 @@ def assign_enrichment(products: List[Dict], fraction: float, seed: int = None) -
     """
     rng = np.random.default_rng(seed)
 
-    # Create copy to avoid modifying original
-    enriched_products = copy.deepcopy(products)
+    # Shallow copies are enough: only the new top-level 'enriched' key is written
+    enriched_products = [dict(product) for product in products]
 
     # Randomly select products for enrichment
     n_enriched = int(len(products) * fraction)
@@ -85,21 +83,18 @@ def apply_enrichment_to_metrics(
         **kwargs: Additional parameters to pass to effect function
 
     Returns:
-        List of modified metrics with treatment effect applied
+        List of modified metrics with treatment effect applied; records of
+        non-enriched products are returned as-is rather than copied
     """
-    # Create lookup for enriched products
-    enriched_ids = {p["product_id"] for p in enriched_products if p.get("enriched", False)}
+    # Select the metrics of enriched products in one vectorized membership test
+    enriched_ids = [p["product_id"] for p in enriched_products if p.get("enriched", False)]
+    product_ids = pd.Series([record["product_id"] for record in metrics], dtype=object)
+    enriched_mask = product_ids.isin(enriched_ids).to_numpy()
 
-    # Apply effect to metrics of enriched products
-    treated_metrics = []
-    for record in metrics:
-        record_copy = copy.deepcopy(record)
-
-        if record_copy["product_id"] in enriched_ids:
-            # Apply treatment effect function with all params as kwargs
-            record_copy = effect_function(record_copy, enrichment_start=enrichment_start, **kwargs)
-
-        treated_metrics.append(record_copy)
+    # Only rows handed to the effect function need their own (shallow) copy; records hold scalars
+    treated_metrics = list(metrics)
+    for i in np.flatnonzero(enriched_mask):
+        treated_metrics[i] = effect_function(dict(metrics[i]), enrichment_start=enrichment_start, **kwargs)
 
     return treated_metrics
 
@@ -119,12 +114,12 @@ def enrich(config_path: str, df: pd.DataFrame, job_info=None, products_df=None)
             - enriched_df: DataFrame with enrichment applied (factual version)
             - potential_outcomes_df: DataFrame with Y0/Y1 for all products, or None if not provided
     """
-    # Load config using ArtifactStore - support both YAML and JSON
-    store, filename = ArtifactStore.from_file_path(config_path)
-    if filename.lower().endswith((".yaml", ".yml")):
-        config = store.read_yaml(filename)
-    else:
-        config = store.read_json(filename)
+    from ..config_processor import get_impact_defaults, load_user_config
+    from .enrichment_library import DATAFRAME_IMPACT_FUNCTIONS
+    from .enrichment_registry import load_effect_function
+
+    # Load config (YAML or JSON, local or S3); unchanged local files are parsed once
+    config = load_user_config(config_path)
 
     # Get impact specification from config
     impact_spec = config.get("IMPACT")
@@ -134,9 +129,6 @@ def enrich(config_path: str, df: pd.DataFrame, job_info=None, products_df=None)
     # Parse impact function
     module_name, function_name, user_params = parse_impact_spec(impact_spec)
 
-    from ..config_processor import get_impact_defaults
-    from .enrichment_registry import load_effect_function
-
     # Merge user params over centralized defaults
     default_params = get_impact_defaults(function_name)
     all_params = {**default_params, **user_params}
@@ -147,15 +139,19 @@ def enrich(config_path: str, df: pd.DataFrame, job_info=None, products_df=None)
     if "product_identifier" not in df.columns:
         raise ValueError("Input DataFrame must contain 'product_identifier' column")
 
-    # Convert DataFrame to list of dicts for metrics, mapping product_identifier to product_id
-    metrics = df.to_dict(orient="records")
-    for record in metrics:
-        record["product_id"] = record["product_identifier"]  # Map product_identifier to product_id for enrichment
-        if "price" in record and "unit_price" not in record:
-            record["unit_price"] = record["price"]  # Ensure unit_price exists
+    # Add the product_id and unit_price aliases as columns
+    aliases = {"product_id": df["product_identifier"]}
+    if "price" in df.columns and "unit_price" not in df.columns:
+        aliases["unit_price"] = df["price"]  # Ensure unit_price exists
+    metrics_df = df.assign(**aliases).reset_index(drop=True)
 
-    # Convert products to list of dicts if provided
-    products = products_df.to_dict(orient="records") if products_df is not None else None
+    # Built-in impact functions work on the frames directly; others receive lists of records
+    if impact_function in DATAFRAME_IMPACT_FUNCTIONS:
+        metrics = metrics_df
+        products = products_df
+    else:
+        metrics = metrics_df.to_dict(orient="records")
+        products = products_df.to_dict(orient="records") if products_df is not None else None
 
     # Apply impact function with all parameters - let the function handle everything
     # Pass job_info and products for product-aware enrichment functions
@@ -168,12 +164,11 @@ def enrich(config_path: str, df: pd.DataFrame, job_info=None, products_df=None)
         treated_metrics = result
         potential_outcomes_df = None
 
-    # Convert back to DataFrame and clean up
-    for record in treated_metrics:
-        record.pop("product_id", None)  # Remove temporary product_id mapping
-        (record.pop("unit_price", None) if "price" in record else None)  # Remove duplicate price field
-
-    enriched_df = pd.DataFrame(treated_metrics)
+    # Impact functions may return records or a DataFrame; drop the temporary aliases column-wise
+    if not isinstance(treated_metrics, pd.DataFrame):
+        treated_metrics = pd.DataFrame(treated_metrics)
+    drop_cols = ["product_id"] + (["unit_price"] if "price" in treated_metrics.columns else [])
+    enriched_df = treated_metrics.drop(columns=drop_cols, errors="ignore")
 
     # Preserve original column order
     original_cols = [col for col in df.columns if col in enriched_df.columns]
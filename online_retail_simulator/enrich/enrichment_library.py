@@ -1,18 +1,17 @@
 """Library of predefined treatment effect functions for catalog enrichment."""
 
-import copy
-from datetime import datetime
+from typing import Optional, Union
 
 import numpy as np
 import pandas as pd
 
 
-def quantity_boost(metrics: list, **kwargs) -> tuple:
+def quantity_boost(metrics: Union[list, pd.DataFrame], **kwargs) -> tuple:
     """
     Boost ordered units by a percentage for enriched products.
 
     Args:
-        metrics: List of metric record dictionaries
+        metrics: List of metric record dictionaries, or a DataFrame of metrics
         **kwargs: Parameters including:
             - effect_size: Percentage increase in ordered units (default: 0.5 for 50% boost)
             - enrichment_fraction: Fraction of products to enrich (default: 0.3)
@@ -22,7 +21,7 @@ def quantity_boost(metrics: list, **kwargs) -> tuple:
 
     Returns:
         Tuple of (treated_metrics, potential_outcomes_df):
-            - treated_metrics: List of modified metric dictionaries with treatment applied
+            - treated_metrics: Metrics with treatment applied, as records or a DataFrame matching the input
             - potential_outcomes_df: DataFrame with Y0_revenue and Y1_revenue for all products
     """
     effect_size = kwargs.get("effect_size", 0.5)
@@ -31,72 +30,32 @@ def quantity_boost(metrics: list, **kwargs) -> tuple:
     seed = kwargs.get("seed", 42)
     min_units = kwargs.get("min_units", 1)
 
+    as_frame = isinstance(metrics, pd.DataFrame)
+    if len(metrics) == 0:
+        return (metrics.copy() if as_frame else []), pd.DataFrame()
+
     rng = np.random.default_rng(seed)
 
-    unique_products = sorted(set(record["product_id"] for record in metrics))
+    # Work column-wise on a single frame instead of copying and branching per record
+    frame = metrics.copy() if as_frame else pd.DataFrame(metrics)
+
+    unique_products = sorted(frame["product_id"].unique())
     n_enriched = int(len(unique_products) * enrichment_fraction)
-    enriched_product_ids = set(rng.choice(unique_products, size=n_enriched, replace=False))
-
-    treated_metrics = []
-    potential_outcomes = {}  # {(product_id, date): {'Y0_revenue': x, 'Y1_revenue': y}}
-    start_date = datetime.strptime(enrichment_start, "%Y-%m-%d")
-
-    for record in metrics:
-        record_copy = copy.deepcopy(record)
-        product_id = record_copy["product_id"]
-        record_date_str = record_copy["date"]
-        record_date = datetime.strptime(record_date_str, "%Y-%m-%d")
-
-        is_enriched = product_id in enriched_product_ids
-        record_copy["enriched"] = is_enriched
-
-        # Calculate Y(0) - baseline revenue (no treatment)
-        y0_revenue = record_copy["revenue"]
-
-        # Calculate Y(1) - revenue if treated (for ALL products)
-        unit_price = record_copy.get("unit_price", record_copy.get("price"))
-        if record_date >= start_date:
-            original_quantity = record_copy["ordered_units"]
-            boosted_quantity = int(original_quantity * (1 + effect_size))
-            boosted_quantity = max(min_units, boosted_quantity)
-            y1_revenue = round(boosted_quantity * unit_price, 2)
-        else:
-            # Before treatment start, Y(1) = Y(0)
-            y1_revenue = y0_revenue
-
-        # Store potential outcomes for ALL products
-        key = (product_id, record_date_str)
-        potential_outcomes[key] = {"Y0_revenue": y0_revenue, "Y1_revenue": y1_revenue}
-
-        # Apply factual outcome (only for treated products)
-        if is_enriched and record_date >= start_date:
-            record_copy["ordered_units"] = boosted_quantity
-            record_copy["revenue"] = y1_revenue
-
-        treated_metrics.append(record_copy)
-
-    # Build potential outcomes DataFrame
-    potential_outcomes_df = pd.DataFrame(
-        [
-            {
-                "product_identifier": pid,
-                "date": d,
-                "Y0_revenue": v["Y0_revenue"],
-                "Y1_revenue": v["Y1_revenue"],
-            }
-            for (pid, d), v in potential_outcomes.items()
-        ]
+    enriched_product_ids = rng.choice(unique_products, size=n_enriched, replace=False)
+
+    potential_outcomes_df = _apply_boost(
+        frame, frame["product_id"], enriched_product_ids, enrichment_start, effect_size, min_units=min_units
     )
 
-    return treated_metrics, potential_outcomes_df
+    return (frame if as_frame else frame.to_dict(orient="records")), potential_outcomes_df
 
 
-def probability_boost(metrics: list, **kwargs) -> tuple:
+def probability_boost(metrics: Union[list, pd.DataFrame], **kwargs) -> tuple:
     """
     Boost sale probability (simulated by ordered units increase as proxy).
 
     Args:
-        metrics: List of metric record dictionaries
+        metrics: List of metric record dictionaries, or a DataFrame of metrics
         **kwargs: Same parameters as quantity_boost
 
     Returns:
@@ -105,7 +64,7 @@ def probability_boost(metrics: list, **kwargs) -> tuple:
     return quantity_boost(metrics, **kwargs)
 
 
-def product_detail_boost(metrics: list, **kwargs) -> tuple:
+def product_detail_boost(metrics: Union[list, pd.DataFrame], **kwargs) -> tuple:
     """
     Product detail regeneration and metrics boost for enrichment experiments.
 
@@ -114,10 +73,10 @@ def product_detail_boost(metrics: list, **kwargs) -> tuple:
     and applies metrics boost effect.
 
     Args:
-        metrics: List of metric record dictionaries
+        metrics: List of metric record dictionaries, or a DataFrame of metrics
         **kwargs: Parameters including:
             - job_info: JobInfo for saving product artifacts (required for saving)
-            - products: List of product dictionaries (required for product details)
+            - products: List of product dictionaries or a products DataFrame (required for product details)
             - effect_size: Percentage increase in ordered units (default: 0.5)
             - ramp_days: Number of days for ramp-up period (default: 7)
             - enrichment_fraction: Fraction of products to enrich (default: 0.3)
@@ -128,7 +87,7 @@ def product_detail_boost(metrics: list, **kwargs) -> tuple:
 
     Returns:
         Tuple of (treated_metrics, potential_outcomes_df):
-            - treated_metrics: List of modified metric dictionaries with treatment applied
+            - treated_metrics: Metrics with treatment applied, as records or a DataFrame matching the input
             - potential_outcomes_df: DataFrame with Y0_revenue and Y1_revenue for all products
     """
     job_info = kwargs.get("job_info")
@@ -142,94 +101,147 @@ def product_detail_boost(metrics: list, **kwargs) -> tuple:
     backend = kwargs.get("backend", "mock")
     quality_boost = kwargs.get("quality_boost", 0.0)
 
+    as_frame = isinstance(metrics, pd.DataFrame)
     rng = np.random.default_rng(seed)
 
-    # 1. Save original product details
-    if job_info and products:
-        job_info.save_df("product_details_original", pd.DataFrame(products))
+    # 1. Save original product details; the products frame is built once and reused below
+    if isinstance(products, pd.DataFrame):
+        products_df = products if len(products) else None
+    else:
+        products_df = pd.DataFrame(products) if products else None
+    if job_info and products_df is not None:
+        job_info.save_df("product_details_original", products_df)
 
     # 2. Select treatment products
-    if products:
-        unique_product_ids = sorted(set(p.get("product_identifier", p.get("product_id")) for p in products))
+    if products_df is not None:
+        unique_product_ids = sorted(set(_product_identifiers(products_df)))
     else:
-        unique_product_ids = sorted(set(record["product_id"] for record in metrics))
+        metric_ids = metrics["product_id"].unique() if as_frame else {record["product_id"] for record in metrics}
+        unique_product_ids = sorted(metric_ids)
 
     n_treatment = int(len(unique_product_ids) * enrichment_fraction)
-    treatment_ids = set(rng.choice(unique_product_ids, size=n_treatment, replace=False))
+    treatment_ids = rng.choice(unique_product_ids, size=n_treatment, replace=False)
 
     # 3. Regenerate product details for treatment products
-    if products and job_info:
-        updated_products = _regenerate_product_details(
-            products, treatment_ids, prompt_path, backend, seed, quality_boost
+    if products_df is not None and job_info:
+        updated_products_df = _regenerate_product_details(
+            products_df, treatment_ids, prompt_path, backend, seed, quality_boost
         )
-        job_info.save_df("product_details_enriched", pd.DataFrame(updated_products))
-
-    # 4. Apply metrics boost effect and calculate potential outcomes
-    treated_metrics = []
-    potential_outcomes = {}  # {(product_id, date): {'Y0_revenue': x, 'Y1_revenue': y}}
-    start_date = datetime.strptime(enrichment_start, "%Y-%m-%d")
-
-    for record in metrics:
-        record_copy = copy.deepcopy(record)
-        product_id = record_copy.get("product_id", record_copy.get("product_identifier"))
-        record_date_str = record_copy["date"]
-        record_date = datetime.strptime(record_date_str, "%Y-%m-%d")
-
-        is_enriched = product_id in treatment_ids
-        record_copy["enriched"] = is_enriched
-
-        # Calculate Y(0) - baseline revenue (no treatment)
-        y0_revenue = record_copy["revenue"]
-
-        # Calculate Y(1) - revenue if treated (for ALL products, with ramp-up)
-        unit_price = record_copy.get("unit_price", record_copy.get("price"))
-        if record_date >= start_date:
-            days_since_start = (record_date - start_date).days
-            ramp_factor = 1.0 if ramp_days <= 0 else min(1.0, days_since_start / ramp_days)
-            adjusted_effect = effect_size * ramp_factor
-
-            original_quantity = record_copy["ordered_units"]
-            boosted_quantity = int(original_quantity * (1 + adjusted_effect))
-            y1_revenue = round(boosted_quantity * unit_price, 2)
-        else:
-            # Before treatment start, Y(1) = Y(0)
-            y1_revenue = y0_revenue
-
-        # Store potential outcomes for ALL products
-        key = (product_id, record_date_str)
-        potential_outcomes[key] = {"Y0_revenue": y0_revenue, "Y1_revenue": y1_revenue}
-
-        # Apply factual outcome (only for treated products)
-        if is_enriched and record_date >= start_date:
-            record_copy["ordered_units"] = boosted_quantity
-            record_copy["revenue"] = y1_revenue
-
-        treated_metrics.append(record_copy)
-
-    # Build potential outcomes DataFrame
-    potential_outcomes_df = pd.DataFrame(
-        [
-            {
-                "product_identifier": pid,
-                "date": d,
-                "Y0_revenue": v["Y0_revenue"],
-                "Y1_revenue": v["Y1_revenue"],
-            }
-            for (pid, d), v in potential_outcomes.items()
-        ]
+        job_info.save_df("product_details_enriched", updated_products_df)
+
+    # 4. Apply metrics boost effect and calculate potential outcomes, column-wise
+    if len(metrics) == 0:
+        return (metrics.copy() if as_frame else []), pd.DataFrame()
+
+    frame = metrics.copy() if as_frame else pd.DataFrame(metrics)
+    if "product_id" in frame.columns:
+        product_ids = frame["product_id"]
+        if "product_identifier" in frame.columns:
+            product_ids = product_ids.fillna(frame["product_identifier"])
+    else:
+        product_ids = frame["product_identifier"]
+
+    potential_outcomes_df = _apply_boost(
+        frame, product_ids, treatment_ids, enrichment_start, effect_size, ramp_days=ramp_days
     )
 
-    return treated_metrics, potential_outcomes_df
+    return (frame if as_frame else frame.to_dict(orient="records")), potential_outcomes_df
+
+
+# Built-in impact functions that accept and return a metrics DataFrame, letting enrich() skip records
+DATAFRAME_IMPACT_FUNCTIONS = frozenset({quantity_boost, probability_boost, product_detail_boost})
+
+
+def _apply_boost(
+    frame: pd.DataFrame,
+    product_ids: pd.Series,
+    treatment_ids,
+    enrichment_start: str,
+    effect_size: float,
+    ramp_days: int = 0,
+    min_units: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Apply the ordered-units boost to a metrics frame in place and compute potential outcomes.
+
+    Shared vectorized kernel of the built-in boost functions. Y(1) uses the
+    boosted units from enrichment_start on (ramped linearly over ramp_days
+    when positive) for ALL products; the factual outcome is only changed for
+    treated products.
+
+    Args:
+        frame: Metrics frame with date, ordered_units, revenue and unit_price/price columns
+        product_ids: Product identifier of each row of frame
+        treatment_ids: Product IDs selected for treatment
+        enrichment_start: Start date of enrichment (YYYY-MM-DD)
+        effect_size: Percentage increase in ordered units at full effect
+        ramp_days: Number of days for ramp-up period (0 applies the full effect immediately)
+        min_units: Optional lower bound on boosted units
+
+    Returns:
+        DataFrame with Y0_revenue and Y1_revenue per (product_identifier, date)
+    """
+    if len(treatment_ids) == 0:
+        is_enriched = np.zeros(len(frame), dtype=bool)
+    else:
+        is_enriched = product_ids.isin(treatment_ids).to_numpy()
+    days_since_start = (pd.to_datetime(frame["date"], format="%Y-%m-%d") - pd.Timestamp(enrichment_start)).dt.days
+    days_since_start = days_since_start.to_numpy()
+    is_post = days_since_start >= 0
+
+    # Calculate Y(0) - baseline revenue (no treatment)
+    y0_revenue = frame["revenue"].to_numpy()
+
+    # Calculate Y(1) - revenue if treated (for ALL products, with ramp-up); before start, Y(1) = Y(0)
+    if "unit_price" in frame.columns:
+        unit_price = frame["unit_price"]
+        if "price" in frame.columns:
+            unit_price = unit_price.fillna(frame["price"])
+    else:
+        unit_price = frame["price"]
+    ramp_factor = 1.0 if ramp_days <= 0 else np.minimum(1.0, days_since_start / ramp_days)
+    adjusted_effect = effect_size * ramp_factor
+    original_quantity = frame["ordered_units"].to_numpy()
+    boosted_quantity = (original_quantity * (1 + adjusted_effect)).astype(np.int64)
+    if min_units is not None:
+        boosted_quantity = np.maximum(min_units, boosted_quantity)
+    y1_revenue = np.where(is_post, np.round(boosted_quantity * unit_price.to_numpy(dtype=float), 2), y0_revenue)
+
+    # Apply factual outcome (only for treated products); untreated frames keep their columns as-is
+    treated = is_enriched & is_post
+    frame["enriched"] = is_enriched
+    if treated.any():
+        frame["ordered_units"] = np.where(treated, boosted_quantity, original_quantity)
+        frame["revenue"] = np.where(treated, y1_revenue, y0_revenue)
+
+    # Store potential outcomes for ALL products
+    return pd.DataFrame(
+        {
+            "product_identifier": product_ids,
+            "date": frame["date"],
+            "Y0_revenue": y0_revenue,
+            "Y1_revenue": y1_revenue,
+        }
+    ).drop_duplicates(subset=["product_identifier", "date"], keep="last", ignore_index=True)
+
+
+def _product_identifiers(products_df: pd.DataFrame) -> pd.Series:
+    """Return each product's product_identifier, falling back to product_id."""
+    if "product_identifier" not in products_df.columns:
+        return products_df["product_id"]
+    if "product_id" in products_df.columns:
+        return products_df["product_identifier"].fillna(products_df["product_id"])
+    return products_df["product_identifier"]
 
 
 def _regenerate_product_details(
-    products: list,
-    treatment_ids: set,
+    products_df: pd.DataFrame,
+    treatment_ids,
     prompt_path: str,
     backend: str,
     seed: int,
     quality_boost: float,
-) -> list:
+) -> pd.DataFrame:
     """
     Regenerate product details for treatment products.
 
@@ -238,30 +250,22 @@ def _regenerate_product_details(
     Updates: quality_score (recalculated + optional boost)
 
     Args:
-        products: List of product dictionaries
-        treatment_ids: Set of product IDs to treat
+        products_df: DataFrame of products
+        treatment_ids: Product IDs to treat
         prompt_path: Path to custom prompt template
         backend: Backend to use ("mock" or "ollama")
         seed: Random seed
         quality_boost: Additional quality score boost for treated products (0.0-1.0)
-    """
-    control_products = []
-    treatment_products = []
-
-    for product in products:
-        product_copy = copy.deepcopy(product)
-        product_id = product_copy.get("product_identifier", product_copy.get("product_id"))
 
-        if product_id in treatment_ids:
-            product_copy["enriched"] = True
-            treatment_products.append(product_copy)
-        else:
-            product_copy["enriched"] = False
-            control_products.append(product_copy)
-
-    if treatment_products:
-        treatment_df = pd.DataFrame(treatment_products)
+    Returns:
+        DataFrame of control products followed by the regenerated treatment products,
+        each flagged with an 'enriched' column
+    """
+    is_treatment = _product_identifiers(products_df).isin(treatment_ids)
+    control_df = products_df.loc[~is_treatment].assign(enriched=False)
+    treatment_df = products_df.loc[is_treatment].assign(enriched=True).reset_index(drop=True)
 
+    if len(treatment_df):
         if backend == "ollama":
             from ..simulate.product_details_ollama import simulate_product_details_ollama
 
@@ -276,8 +280,12 @@ def _regenerate_product_details(
         regenerated_df["enriched"] = True
 
         # Apply quality boost for treated products (0.0 = no boost)
-        regenerated_df["quality_score"] = regenerated_df["quality_score"].apply(lambda x: min(x + quality_boost, 1.0))
+        regenerated_df["quality_score"] = (regenerated_df["quality_score"] + quality_boost).clip(upper=1.0)
 
-        treatment_products = regenerated_df.to_dict("records")
+        treatment_df = regenerated_df
 
-    return control_products + treatment_products
+    if len(control_df) == 0:
+        return treatment_df
+    if len(treatment_df) == 0:
+        return control_df.reset_index(drop=True)
+    return pd.concat([control_df, treatment_df], ignore_index=True)
@@ -3,7 +3,6 @@
 import json
 
 import pandas as pd
-import requests
 
 from ..quality import calculate_quality_score
 
@@ -50,6 +49,9 @@ def simulate_product_details_ollama(
     Returns:
         DataFrame with added title, description, brand, features
     """
+    # Imported here so the package import does not pay for requests unless Ollama is used
+    import requests
+
     # Load custom prompt or use default
     prompt_template = _load_prompt_template(prompt_path) if prompt_path else PROMPT_TEMPLATE
 
@@ -9,6 +9,8 @@ from typing import Dict
 import numpy as np
 import pandas as pd
 
+from .synthesizer_fit import fit_gaussian_copula
+
 
 def simulate_products_synthesizer_based(config: Dict) -> pd.DataFrame:
     """
@@ -18,15 +20,6 @@ def simulate_products_synthesizer_based(config: Dict) -> pd.DataFrame:
     Returns:
         DataFrame of synthetic products
     """
-    try:
-        from sdv.metadata import SingleTableMetadata
-        from sdv.single_table import GaussianCopulaSynthesizer
-    except ImportError:
-        raise ImportError(
-            "SDV is required for synthesizer-based simulation. "
-            "Install with: pip install online-retail-simulator[synthesizer]"
-        )
-
     params = config["SYNTHESIZER"]["PRODUCTS"]["PARAMS"]
     training_data_path, num_rows, seed = (
         params["training_data_path"],
@@ -34,18 +27,10 @@ def simulate_products_synthesizer_based(config: Dict) -> pd.DataFrame:
         params["seed"],
     )
 
-    # Load training data
-    training_data = pd.read_csv(training_data_path)
-
-    # Step 1: Create metadata and synthesizer
-    metadata = SingleTableMetadata()
-    metadata.detect_from_dataframe(training_data)
-    synthesizer = GaussianCopulaSynthesizer(metadata)
-
-    # Step 2: Train the synthesizer
-    synthesizer.fit(training_data)
+    # Step 1: Fit (or reuse) the synthesizer for this training data
+    synthesizer = fit_gaussian_copula(training_data_path)
 
-    # Step 3: Generate synthetic data with seed (legacy API required by SDV internals)
+    # Step 2: Generate synthetic data with seed (legacy API required by SDV internals)
     np.random.seed(seed)
     synthetic_data = synthesizer.sample(num_rows=num_rows)
 
@@ -0,0 +1,81 @@
+"""
+Gaussian Copula fitting shared by the synthesizer-based backends.
+
+Fitted synthesizers are reused while the local training file is unchanged.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+import pandas as pd
+
+
+def _fit_gaussian_copula(training_data_path: str):
+    """
+    Fit a Gaussian Copula synthesizer on a training CSV.
+
+    Args:
+        training_data_path: Path to the training CSV (local or remote)
+
+    Returns:
+        Fitted synthesizer
+
+    Raises:
+        ImportError: If SDV is not installed
+    """
+    try:
+        from sdv.metadata import SingleTableMetadata
+        from sdv.single_table import GaussianCopulaSynthesizer
+    except ImportError:
+        raise ImportError(
+            "SDV is required for synthesizer-based simulation. "
+            "Install with: pip install online-retail-simulator[synthesizer]"
+        )
+
+    # Load training data
+    training_data = pd.read_csv(training_data_path)
+
+    # Create metadata and synthesizer, then train it
+    metadata = SingleTableMetadata()
+    metadata.detect_from_dataframe(training_data)
+    synthesizer = GaussianCopulaSynthesizer(metadata)
+    synthesizer.fit(training_data)
+    return synthesizer
+
+
+@lru_cache(maxsize=8)
+def _fit_gaussian_copula_cached(resolved_path: str, mtime_ns: int, size: int):
+    """
+    Fit once per (path, modification time, size) of a local training file.
+
+    Args:
+        resolved_path: Resolved path of the local training CSV
+        mtime_ns: Modification time of the file, part of the cache key
+        size: Size of the file in bytes, part of the cache key
+
+    Returns:
+        Fitted synthesizer, shared between calls with the same key
+    """
+    return _fit_gaussian_copula(resolved_path)
+
+
+def fit_gaussian_copula(training_data_path: str):
+    """
+    Return a Gaussian Copula synthesizer fitted on the training data.
+
+    Args:
+        training_data_path: Path to the training CSV (local or remote)
+
+    Returns:
+        Fitted synthesizer with its sampling state reset
+    """
+    local_path = Path(training_data_path)
+    if local_path.is_file():
+        stat = local_path.stat()
+        synthesizer = _fit_gaussian_copula_cached(str(local_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    else:
+        synthesizer = _fit_gaussian_copula(training_data_path)
+
+    # A cached synthesizer may have sampled before; start from the freshly fitted state
+    synthesizer.reset_sampling()
+    return synthesizer
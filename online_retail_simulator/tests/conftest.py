@@ -1,5 +1,6 @@
 """Shared pytest fixtures for test configuration."""
 
+import shutil
 from pathlib import Path
 
 import pytest
@@ -36,3 +37,24 @@ def config_rule_full():
 def config_randomness_test():
     """Base config for randomness tests."""
     return load_fixture("config_randomness_test.yaml")
+
+
+@pytest.fixture(scope="session")
+def rule_job_info():
+    """Rule-based simulation of config_rule.yaml, generated once per session.
+
+    The job is shared and must stay read-only; tests that enrich use ``rule_job_copy``.
+    """
+    from online_retail_simulator import simulate
+
+    return simulate(str(Path(__file__).parent / "config_rule.yaml"))
+
+
+@pytest.fixture
+def rule_job_copy(rule_job_info, tmp_path):
+    """Fresh per-test copy of the session simulation job for tests that write artifacts."""
+    from online_retail_simulator.manage import JobInfo
+
+    source_dir = Path(rule_job_info.storage_path) / rule_job_info.job_id
+    shutil.copytree(source_dir, tmp_path / rule_job_info.job_id)
+    return JobInfo(job_id=rule_job_info.job_id, storage_path=str(tmp_path))
@@ -0,0 +1,27 @@
+"""Tests for cached config loading."""
+
+import os
+import tempfile
+
+from online_retail_simulator.config_processor import clear_config_cache, load_user_config
+
+
+def test_load_user_config_returns_private_copies_and_sees_changes():
+    """Cached parses are copied per call and invalidated when the file changes."""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+        f.write("IMPACT:\n  FUNCTION: quantity_boost\n")
+        config_path = f.name
+
+    try:
+        clear_config_cache()
+        first = load_user_config(config_path)
+        first["IMPACT"]["FUNCTION"] = "mutated"
+        assert load_user_config(config_path)["IMPACT"]["FUNCTION"] == "quantity_boost"
+
+        with open(config_path, "w") as f:
+            f.write("IMPACT:\n  FUNCTION: product_detail_boost\n")
+        assert load_user_config(config_path)["IMPACT"]["FUNCTION"] == "product_detail_boost"
+
+    finally:
+        clear_config_cache()
+        os.unlink(config_path)
@@ -9,7 +9,7 @@ import pytest
 from online_retail_simulator import enrich, simulate
 
 
-def test_enrich_basic():
+def test_enrich_basic(rule_job_copy):
     """Test basic enrichment functionality."""
     # Create test config
     config_content = """
@@ -27,15 +27,11 @@ IMPACT:
         config_path = f.name
 
     try:
-        # Generate test data
-        test_config_path = os.path.join(os.path.dirname(__file__), "config_rule.yaml")
-        job_info = simulate(test_config_path)
-
         # Load original sales before enrichment
-        original_metrics = job_info.load_df("metrics")
+        original_metrics = rule_job_copy.load_df("metrics")
 
         # Apply enrichment
-        enriched_job_info = enrich(config_path, job_info)
+        enriched_job_info = enrich(config_path, rule_job_copy)
 
         # Load enriched data
         enriched_metrics = enriched_job_info.load_df("enriched")
@@ -65,7 +61,7 @@ IMPACT:
         os.unlink(config_path)
 
 
-def test_enrich_product_detail_boost():
+def test_enrich_product_detail_boost(rule_job_copy):
     """Test product detail boost with ramp-up."""
     config_content = """
 IMPACT:
@@ -83,15 +79,11 @@ IMPACT:
         config_path = f.name
 
     try:
-        # Generate test data
-        test_config_path = os.path.join(os.path.dirname(__file__), "config_rule.yaml")
-        job_info = simulate(test_config_path)
-
         # Load original sales before enrichment
-        original_metrics = job_info.load_df("metrics")
+        original_metrics = rule_job_copy.load_df("metrics")
 
         # Apply enrichment
-        enriched_job_info = enrich(config_path, job_info)
+        enriched_job_info = enrich(config_path, rule_job_copy)
 
         # Load enriched data
         enriched_metrics = enriched_job_info.load_df("enriched")
@@ -110,7 +102,7 @@ IMPACT:
         os.unlink(config_path)
 
 
-def test_enrich_invalid_config():
+def test_enrich_invalid_config(rule_job_copy):
     """Test error handling for invalid config."""
     config_content = """
 INVALID_KEY: "test"
@@ -121,13 +113,9 @@ INVALID_KEY: "test"
         config_path = f.name
 
     try:
-        # Generate test data
-        test_config_path = os.path.join(os.path.dirname(__file__), "config_rule.yaml")
-        job_info = simulate(test_config_path)
-
         # Should raise error for missing IMPACT
         with pytest.raises(ValueError, match="Config must include 'IMPACT' specification"):
-            enrich(config_path, job_info)
+            enrich(config_path, rule_job_copy)
 
     finally:
         os.unlink(config_path)
@@ -205,3 +193,37 @@ IMPACT:
 
     finally:
         os.unlink(config_path)
+
+
+def test_enrich_accepts_dataframe_result(rule_job_copy):
+    """Test that impact functions may return a DataFrame instead of records."""
+    from online_retail_simulator import clear_enrichment_registry, register_enrichment_function
+
+    def dataframe_boost(metrics, **kwargs):
+        df = pd.DataFrame(metrics)
+        df["ordered_units"] = df["ordered_units"] * 2
+        return df
+
+    config_content = """
+IMPACT:
+  FUNCTION: "dataframe_boost"
+"""
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
+        f.write(config_content)
+        config_path = f.name
+
+    try:
+        register_enrichment_function("dataframe_boost", dataframe_boost)
+
+        original_metrics = rule_job_copy.load_df("metrics")
+
+        enriched_metrics = enrich(config_path, rule_job_copy).load_df("enriched")
+
+        # Temporary aliases are dropped and original column order is kept
+        assert list(enriched_metrics.columns) == list(original_metrics.columns)
+        assert enriched_metrics["ordered_units"].sum() == 2 * original_metrics["ordered_units"].sum()
+
+    finally:
+        clear_enrichment_registry()
+        os.unlink(config_path)
@@ -251,6 +251,20 @@ class TestQuantityBoost:
         pre_start = potential_outcomes[potential_outcomes["date"] < "2024-11-15"]
         assert (pre_start["Y1_revenue"] == pre_start["Y0_revenue"]).all()
 
+    def test_quantity_boost_accepts_dataframe(self):
+        """Test that DataFrame input gives the same result as records, as a DataFrame."""
+        sales = create_test_sales()
+        sales_df = pd.DataFrame(sales)
+
+        result_records, po_records = quantity_boost(sales, enrichment_fraction=0.5, seed=42)
+        result_df, po_df = quantity_boost(sales_df, enrichment_fraction=0.5, seed=42)
+
+        assert isinstance(result_df, pd.DataFrame)
+        pd.testing.assert_frame_equal(result_df, pd.DataFrame(result_records))
+        pd.testing.assert_frame_equal(po_df, po_records)
+        # Input DataFrame is left untouched
+        pd.testing.assert_frame_equal(sales_df, pd.DataFrame(sales))
+
 
 class TestProbabilityBoost:
     """Test probability_boost function."""
@@ -3,7 +3,6 @@
 import pandas as pd
 import pytest
 
-from conftest import OLLAMA_AVAILABLE
 from online_retail_simulator.simulate.product_details_mock import simulate_product_details_mock
 
 
@@ -61,7 +60,6 @@ class TestProductDetailsMock:
 
 
 @pytest.mark.llm
-@pytest.mark.skipif(not OLLAMA_AVAILABLE, reason="Ollama server not available")
 class TestProductDetailsOllama:
     """Tests for Ollama backend (requires Ollama server running)."""
 
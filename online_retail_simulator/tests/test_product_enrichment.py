@@ -6,12 +6,11 @@ import tempfile
 import pandas as pd
 import pytest
 
-from conftest import OLLAMA_AVAILABLE
 from online_retail_simulator import enrich, load_job_results, simulate
 from online_retail_simulator.enrich.enrichment_library import _regenerate_product_details
 
 
-def test_product_detail_boost_basic():
+def test_product_detail_boost_basic(rule_job_copy):
     """Test basic product_detail_boost functionality."""
     config_content = """
 IMPACT:
@@ -29,15 +28,11 @@ IMPACT:
         config_path = f.name
 
     try:
-        # Generate test data
-        test_config_path = os.path.join(os.path.dirname(__file__), "config_rule.yaml")
-        job_info = simulate(test_config_path)
-
         # Load original sales before enrichment
-        original_metrics = job_info.load_df("metrics")
+        original_metrics = rule_job_copy.load_df("metrics")
 
         # Apply enrichment
-        enriched_job_info = enrich(config_path, job_info)
+        enriched_job_info = enrich(config_path, rule_job_copy)
 
         # Load enriched data
         enriched_metrics = enriched_job_info.load_df("enriched")
@@ -57,7 +52,7 @@ IMPACT:
         os.unlink(config_path)
 
 
-def test_product_detail_boost_saves_original_products():
+def test_product_detail_boost_saves_original_products(rule_job_copy):
     """Test that product_detail_boost saves original products."""
     config_content = """
 IMPACT:
@@ -75,12 +70,8 @@ IMPACT:
         config_path = f.name
 
     try:
-        # Generate test data
-        test_config_path = os.path.join(os.path.dirname(__file__), "config_rule.yaml")
-        job_info = simulate(test_config_path)
-
         # Apply enrichment
-        enriched_job_info = enrich(config_path, job_info)
+        enriched_job_info = enrich(config_path, rule_job_copy)
 
         # Check that product_details_original was saved
         original_details = enriched_job_info.load_df("product_details_original")
@@ -92,7 +83,7 @@ IMPACT:
         os.unlink(config_path)
 
 
-def test_product_detail_boost_saves_enriched_products():
+def test_product_detail_boost_saves_enriched_products(rule_job_copy):
     """Test that product_detail_boost saves enriched products with flag."""
     config_content = """
 IMPACT:
@@ -110,12 +101,8 @@ IMPACT:
         config_path = f.name
 
     try:
-        # Generate test data
-        test_config_path = os.path.join(os.path.dirname(__file__), "config_rule.yaml")
-        job_info = simulate(test_config_path)
-
         # Apply enrichment
-        enriched_job_info = enrich(config_path, job_info)
+        enriched_job_info = enrich(config_path, rule_job_copy)
 
         # Check that product_details_enriched was saved
         enriched_details = enriched_job_info.load_df("product_details_enriched")
@@ -138,7 +125,7 @@ IMPACT:
         os.unlink(config_path)
 
 
-def test_product_detail_boost_load_job_results():
+def test_product_detail_boost_load_job_results(rule_job_copy):
     """Test that load_job_results includes product details files."""
     config_content = """
 IMPACT:
@@ -156,12 +143,8 @@ IMPACT:
         config_path = f.name
 
     try:
-        # Generate test data
-        test_config_path = os.path.join(os.path.dirname(__file__), "config_rule.yaml")
-        job_info = simulate(test_config_path)
-
         # Apply enrichment
-        enriched_job_info = enrich(config_path, job_info)
+        enriched_job_info = enrich(config_path, rule_job_copy)
 
         # Load all results
         results = load_job_results(enriched_job_info)
@@ -179,29 +162,36 @@ IMPACT:
 
 def test_regenerate_product_details_helper():
     """Test the _regenerate_product_details helper function."""
-    products = [
-        {"product_identifier": "A001", "category": "Electronics", "price": 99.99, "title": "Old Title 1"},
-        {"product_identifier": "A002", "category": "Electronics", "price": 49.99, "title": "Old Title 2"},
-        {"product_identifier": "A003", "category": "Clothing", "price": 29.99, "title": "Old Title 3"},
-    ]
+    products_df = pd.DataFrame(
+        [
+            {"product_identifier": "A001", "category": "Electronics", "price": 99.99, "title": "Old Title 1"},
+            {"product_identifier": "A002", "category": "Electronics", "price": 49.99, "title": "Old Title 2"},
+            {"product_identifier": "A003", "category": "Clothing", "price": 29.99, "title": "Old Title 3"},
+        ]
+    )
     treatment_ids = {"A001", "A003"}
 
-    updated = _regenerate_product_details(products, treatment_ids, None, "mock", 42, quality_boost=0.0)
+    updated = _regenerate_product_details(products_df, treatment_ids, None, "mock", 42, quality_boost=0.0)
 
-    # Check all products are returned
+    # Check all products are returned as a DataFrame
+    assert isinstance(updated, pd.DataFrame)
     assert len(updated) == 3
+    assert {"product_identifier", "title", "enriched", "quality_score"} <= set(updated.columns)
 
     # Check enriched flag
-    enriched_flags = {p["product_identifier"]: p["enriched"] for p in updated}
-    assert enriched_flags["A001"] is True
-    assert enriched_flags["A002"] is False
-    assert enriched_flags["A003"] is True
+    enriched_flags = dict(zip(updated["product_identifier"], updated["enriched"]))
+    assert enriched_flags["A001"]
+    assert not enriched_flags["A002"]
+    assert enriched_flags["A003"]
+
+    # Control products keep their original details
+    control = updated[updated["product_identifier"] == "A002"].iloc[0]
+    assert control["title"] == "Old Title 2"
 
-    # Check treatment products have new titles (from mock treatment mode)
-    for p in updated:
-        if p["product_identifier"] in treatment_ids:
-            assert "title" in p
-            # Treatment mode uses different adjectives/brands
+    # Treatment products get regenerated titles (from mock treatment mode)
+    treated = updated[updated["product_identifier"].isin(treatment_ids)]
+    assert treated["title"].notna().all()
+    assert not treated["title"].str.startswith("Old Title").any()
 
 
 def test_product_detail_boost_reproducibility():
@@ -243,7 +233,6 @@ IMPACT:
 
 
 @pytest.mark.llm
-@pytest.mark.skipif(not OLLAMA_AVAILABLE, reason="Ollama server not available")
 def test_product_detail_boost_with_ollama():
     """Test product_detail_boost with actual Ollama backend."""
     config_content = """